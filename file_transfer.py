@@ -25,74 +25,268 @@ Answers to questions:
 """
 
 import os
+import mmap
 import argparse
 import socket
 import struct
+import sys
+import tempfile
+import threading
+
+try:
+    import resource                 # Only available on Unix
+except ImportError:
+    resource = None
+
+
+CHUNK_SIZE = 64 * 1024          # Number of bytes of a file that are read or written at a time
+RECV_BUFFER_SIZE = 1 << 20      # Size of the buffer that incoming data is read through
+BUF_SIZE = 1 << 20              # Smallest kernel send and receive buffers for each socket (not used on Linux)
+SOCKET_TIMEOUT = 60             # Seconds a send or receive can wait before the connection is given up on
+KEEPALIVE_IDLE = 30             # Seconds a connection can be idle before keepalive probes are sent
+KEEPALIVE_INTERVAL = 10         # Seconds between keepalive probes
+KEEPALIVE_COUNT = 3             # Number of unanswered keepalive probes before the connection is dropped
+MAX_STR_LENGTH = 64 * 1024      # Longest string the other side may send (filenames and error messages)
+MAX_LIST_LENGTH = 16 << 20      # Longest block of strings the other side may send as a list
+IOV_MAX = 1024                  # Most systems don't allow more buffers than this in one sendmsg() call
+VERSION = 5                     # Protocol version, must match between the client and server
+_UMASK = os.umask(0)            # The umask can only be read by setting it, so it is put straight back
+os.umask(_UMASK)
+FILE_MODE = 0o666 & ~_UMASK     # Permissions open() would give a new file
+UPLOAD_DIR = os.path.realpath('uploads')    # Directory the server saves uploaded files into and serves them from
+
+# Status byte sent by the server in front of each file requested by the client
+FILE_OK = 0                     # Followed by the size of the file and then its data
+FILE_MISSING = 1                # The file doesn't exist on the server
+FILE_ERROR = 2                  # Followed by a string explaining why the file couldn't be sent
+
+# Precompiled struct formats so the format strings are not parsed again on every send and receive
+_I32 = struct.Struct('<i')
+_BOOL = struct.Struct('<?')
+_FILE_HEADER = struct.Struct('<Bi')     # FILE_OK status followed by the size of the file
+
+# Small buffer for receiving struct-formatted values, one per thread since each client has its own
+_scratch = threading.local()
 
 
 #######################################
 ########## Utility Functions ##########
 #######################################
-def read_file(filename):
-    """Read and return the binary data for a file."""
-    with open(filename, 'rb') as file:
-        return file.read()
+def setup_socket(sock):
+    """Sets the options used on every connected socket."""
+    """Turns off Nagle's algorithm so small headers are not held back waiting for an acknowledgement"""
+    """and makes sure a peer that disappears mid-transfer can't leave us waiting on it forever"""
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    if hasattr(socket, 'TCP_KEEPIDLE'):     # The keepalive timing can only be tuned on some systems (Linux)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, KEEPALIVE_INTERVAL)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, KEEPALIVE_COUNT)
+    sock.settimeout(SOCKET_TIMEOUT)
+
+
+def raise_open_file_limit():
+    """
+    Raises the limit on open files to the most allowed (on Unix) so the server can handle as many
+    clients at the same time as possible, since each one needs a socket and a file.
+    """
+    if resource is None:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    try:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    except (ValueError, OSError):           # Some systems (macOS) refuse an unlimited hard limit, so keep the current one
+        pass
+
+
+def set_buffer_sizes(sock):
+    """
+    Raises the kernel send and receive buffers of the socket so large transfers are not limited by
+    the TCP window. This must be done before connecting (or listening) for the window to scale.
+    """
+    """Linux grows the buffers on its own (well past BUF_SIZE), and setting them at all turns that off"""
+    if sys.platform.startswith('linux'):
+        return
+    for option in (socket.SO_SNDBUF, socket.SO_RCVBUF):
+        if sock.getsockopt(socket.SOL_SOCKET, option) < BUF_SIZE:     # Never shrinks a buffer that is already bigger
+            sock.setsockopt(socket.SOL_SOCKET, option, BUF_SIZE)
+
 
+def send_parts(sock, parts):
+    """
+    Sends a list of byte strings using the socket with a single scatter-gather sendmsg() call where
+    available, otherwise (or if there are too many of them) they are joined and sent with sendall().
+    """
+    if hasattr(sock, 'sendmsg') and len(parts) <= IOV_MAX:
+        total = sum(len(part) for part in parts)
+        sent = sock.sendmsg(parts)
+        if sent < total:                # Sends whatever didn't fit in the socket buffer
+            sock.sendall(b''.join(parts)[sent:])
+    else:
+        sock.sendall(b''.join(parts))
 
-def save_file(filename, data):
-    """Save the binary data for a file."""
-    with open(filename, 'wb') as file:
-        file.write(data)
 
+def set_cork(sock, corked):
+    """
+    Corks or uncorks the socket on systems that support it (Linux). While corked, the header and
+    body of a file are coalesced into full packets instead of the header going out on its own.
+    """
+    if hasattr(socket, 'TCP_CORK'):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, corked)
 
-def recv_all(sock, num_bytes):
-    """Read the given number of bytes from the socket. Don't stop until all data is recieved."""
-    """Saves the maximum amount of bytes and then keeps saving more bytes until there are no more bytes to save"""
-    data = sock.recv(num_bytes)
-    while len(data) != num_bytes:
-        data += sock.recv(num_bytes)
+
+def open_reader(sock):
+    """
+    Returns a buffered file object for reading from the socket. Small reads such as length prefixes
+    are then served from the buffer instead of each needing their own system call.
+    """
+    return sock.makefile('rb', buffering=RECV_BUFFER_SIZE)
+
+
+def recv_all(rfile, num_bytes):
+    """Read the given number of bytes from the socket reader. Don't stop until all data is recieved."""
+    """The buffered reader keeps reading until it has all the bytes or the other side closes the connection"""
+    if num_bytes < 0:                   # A negative size would read until the connection closes
+        raise ValueError(f'invalid length {num_bytes}')
+    data = rfile.read(num_bytes)
+    if len(data) != num_bytes:          # Fewer bytes means the other side closed the connection
+        raise ConnectionError('connection closed before all data was received')
 
     return data
 
 
-def recv_formatted_data(sock, frmt):
+def recv_all_into(rfile, view):
+    """Fills the given memoryview from the socket reader. Don't stop until all data is recieved."""
+    offset = 0
+    while offset < len(view):
+        received = rfile.readinto(view[offset:])
+        if not received:                # Nothing received means the other side closed the connection
+            raise ConnectionError('connection closed before all data was received')
+        offset += received
+
+
+def upload_path(filename):
     """
-    Receives struct-formatted data from the given socket according to the struct format given and
-    returns a tuple of values.
+    Returns the absolute path that a file with the given name is saved to (or served from) on the
+    server, or None if the name would end up outside of UPLOAD_DIR.
     """
-    return struct.unpack(frmt, recv_all(sock, struct.calcsize(frmt)))
+    """Only the last part of the name is used so clients cannot pick the directory the file goes in"""
+    path = os.path.realpath(os.path.join(UPLOAD_DIR, os.path.basename(filename)))
+    if os.path.dirname(path) != UPLOAD_DIR:
+        return None
 
+    return path
 
-def recv_single_value(sock, frmt):
+
+def recv_into_file(rfile, num_bytes, file):
+    """
+    Receives the given number of bytes from the socket reader and writes them into the open binary
+    file, a chunk at a time so the whole file never has to be held in memory.
+    """
+    """Reuses a single chunk-sized buffer for every receive and writes out only the part that was filled"""
+    buf = bytearray(CHUNK_SIZE)
+    view = memoryview(buf)
+    remaining = num_bytes
+    while remaining > 0:
+        received = rfile.readinto(view[:min(CHUNK_SIZE, remaining)])
+        if not received:                # Nothing received means the other side closed the connection
+            raise ConnectionError('connection closed before all data was received')
+        file.write(view[:received])
+        remaining -= received
+
+
+def recv_to_file(rfile, num_bytes, filename):
     """
-    Receives a single value from the given socket according to the struct format given and returns
-    it.
+    Receives the given number of bytes from the socket reader and saves them as the named file. The
+    data goes into a temporary file next to it first, which only replaces the named file once all of
+    the data has arrived, so a transfer that is cut off never leaves a truncated file behind.
     """
-    return recv_formatted_data(sock, frmt)[0]
+    if num_bytes < 0:                   # The size comes from the other side, so it can't be trusted
+        raise ValueError(f'invalid file size {num_bytes}')
+    if filename == os.devnull:          # The data is only being discarded
+        with open(filename, 'wb') as file:
+            recv_into_file(rfile, num_bytes, file)
+        return
+
+    fd, temp_path = tempfile.mkstemp(prefix='.', suffix='.part', dir=os.path.dirname(filename) or '.')
+    try:
+        with open(fd, 'wb') as file:
+            recv_into_file(rfile, num_bytes, file)
+        os.chmod(temp_path, FILE_MODE)  # mkstemp() makes the file private, so give it the usual permissions
+        os.replace(temp_path, filename)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def send_from_file(sock, file, size):
+    """
+    Sends the given number of bytes from the open binary file using the socket. Uses the sendfile()
+    system call where available so the data goes straight from the file to the socket without being
+    copied through Python. Elsewhere the file is memory-mapped and sent from the mapping, so its data
+    never has to be read into a bytes object.
+    """
+    if not size:                        # Empty files have nothing to send (and can't be memory-mapped)
+        return
+    if hasattr(os, 'sendfile'):
+        sent = sock.sendfile(file, count=size)
+        if sent != size:                # The file shrank, so the size sent ahead of it is wrong and the stream can't continue
+            raise OSError(f'{file.name} changed size while it was being sent ({sent} of {size} bytes sent)')
+    else:
+        with mmap.mmap(file.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+            sock.sendall(mapped)
+
+
+def recv_formatted_data(rfile, frmt):
+    """
+    Receives struct-formatted data from the given socket reader according to the precompiled
+    struct.Struct format given and returns a tuple of values.
+    """
+    """Receives into this thread's scratch buffer and unpacks from there, so no bytes object is created"""
+    view = getattr(_scratch, 'view', None)
+    if view is None:
+        view = _scratch.view = memoryview(bytearray(8))     # Big enough for every format used
+    recv_all_into(rfile, view[:frmt.size])
+    return frmt.unpack_from(view)
 
 
-def recv_str(sock):
+def recv_single_value(rfile, frmt):
     """
-    Receives a string using the socket. The string must be prefixed with its length and encoded.
+    Receives a single value from the given socket reader according to the precompiled struct.Struct
+    format given and returns it.
+    """
+    return recv_formatted_data(rfile, frmt)[0]
+
+
+def recv_str(rfile):
+    """
+    Receives a string using the socket reader. The string must be prefixed with its length and encoded.
     """
     """Gets the length of the string being sent and then receives that many bytes and returns that byte string decoded"""
-    length = recv_single_value(sock, '<i')
-    data = recv_all(sock, length)
+    length = recv_single_value(rfile, _I32)
+    if length > MAX_STR_LENGTH:         # The reader allocates the whole length up front, so it is limited
+        raise ValueError(f'string length {length} is over the limit of {MAX_STR_LENGTH}')
+    data = recv_all(rfile, length)
     return data.decode()
 
 
-def recv_str_list(sock):
+def recv_str_list(rfile):
     """
-    Receives a list of strings from the socket. The list is prefixed with the length and each string
-    is prefixed with recv_str().
+    Receives a list of strings from the socket reader. The strings are sent as one encoded block,
+    separated by NUL characters and prefixed with the number of strings and the length of the block.
     """
-    """Gets the length of the list being sent. Then receives each string in the list and appends each string to a list."""
-    length = recv_single_value(sock, '<i')
-    lst = []
-    for i in range(length):
-        lst.append(recv_str(sock))
-    
-    return lst
+    """Receives the whole block at once and splits it back into the strings, the count tells [] and [''] apart"""
+    count = recv_single_value(rfile, _I32)
+    length = recv_single_value(rfile, _I32)
+    if length > MAX_LIST_LENGTH:        # The reader allocates the whole length up front, so it is limited
+        raise ValueError(f'list length {length} is over the limit of {MAX_LIST_LENGTH}')
+    if not count:
+        return []
+    strings = recv_all(rfile, length).decode().split('\x00')
+    if len(strings) != count:
+        raise ValueError(f'expected {count} strings but received {len(strings)}')
+
+    return strings
 
 
 def send_str(sock, string):
@@ -100,28 +294,41 @@ def send_str(sock, string):
     Sends a string using the socket. The string is encoded then prefixed with the length as a 4-byte
     integer.
     """
-    """Encodes the string, packs the string with the length first. Then sends the string with length first"""
+    """Encodes the string and sends it with its packed length in front of it"""
     string = string.encode()
-    data = struct.pack('<i', len(string))
-    data += struct.pack(str(len(string)) + 's', string)
-    sock.sendall(data)
+    sock.sendall(_I32.pack(len(string)) + string)
 
 
 def send_str_list(sock, strings):
     """
-    Sends a list of strings using the socket. The list is prefixed with its length as a 4-byte
-    integer. Each string is sent with send_str().
+    Sends a list of strings using the socket. The strings are encoded and joined into one block
+    separated by NUL characters, which is prefixed with the number of strings and its length as
+    4-byte integers.
     """
-    """Packs the length of the list and sends it. Then sends each string within the list separately"""
-    data = struct.pack('<i', len(strings))
-    sock.sendall(data)
-    for string in strings:
-        send_str(sock, string)
+    """Filenames can't contain NUL characters, so it is safe to use as the separator"""
+    block = b'\x00'.join(string.encode() for string in strings)
+    sock.sendall(_I32.pack(len(strings)) + _I32.pack(len(block)) + block)
+
+
+def send_status(sock, status):
+    """Sends a single status byte using the socket."""
+    sock.sendall(bytes([status]))
+
+
+def recv_status(rfile):
+    """Receives a single status byte from the socket reader and returns it."""
+    return recv_all(rfile, 1)[0]
+
+
+def send_file_error(sock, exception):
+    """Sends the FILE_ERROR status using the socket followed by the reason the file couldn't be sent."""
+    send_status(sock, FILE_ERROR)
+    send_str(sock, str(exception))
 
 
 def send_bool(sock, boolean):
     """Used this function to send a boolean value"""
-    data = struct.pack('<?', boolean)
+    data = _BOOL.pack(boolean)
     sock.sendall(data)
     
 
@@ -131,41 +338,68 @@ def send_bool(sock, boolean):
 def get_files(addr, port, filenames):
     """Gets the files from the server at addr:port."""
     client = socket.socket()
+    set_buffer_sizes(client)
     client.connect((addr, port))
-    with client:
-        version_number = recv_single_value(client, '<i')
-        if version_number != 1:           # Checks the version number to be 1
+    setup_socket(client)
+    with client, open_reader(client) as rfile:
+        version_number = recv_single_value(rfile, _I32)
+        if version_number != VERSION:     # Checks the version number matches ours
             print('You are on the wrong version.')
             return 
         send_bool(client, True)
         send_str_list(client, filenames)
         for filename in filenames:          # Loop through every file trying to be saved
-            file_exists = recv_single_value(client, '<?')
-            if file_exists:                 # Executes if the file exists on the server
-                size_of_file = recv_single_value(client, '<i')
-                file_data = recv_all(client, size_of_file)
-                save_file(filename, file_data)        # Receives the length of the file's data and then the data and saves the file data into a file
-            else:
+            status = recv_status(rfile)
+            if status == FILE_OK:           # Executes if the server is sending the file
+                size_of_file = recv_single_value(rfile, _I32)
+                recv_to_file(rfile, size_of_file, filename)     # Receives the length of the file's data and then streams the data into the file
+            elif status == FILE_MISSING:
                 print(f'{filename} doesn\'t exist on the server')
+            else:
+                print(f'{filename} couldn\'t be sent by the server: {recv_str(rfile)}')
         
 
 def put_files(addr, port, filenames):
-    """Gets the files from the server at addr:port."""
+    """
+    Puts the files onto the server at addr:port. Returns True only if every file was put, files that
+    are missing or unreadable are reported and skipped.
+    """
+    uploads = []
+    for filename in filenames:                          # Gets the size of every file first, skipping the ones that can't be read
+        try:
+            with open(filename, 'rb') as file:
+                size_of_file = os.fstat(file.fileno()).st_size
+        except (FileNotFoundError, PermissionError, IsADirectoryError, NotADirectoryError) as exception:
+            print(exception)                            # Other errors (e.g. too many open files) aren't about the file, so they aren't skipped
+            continue
+        uploads.append((filename, size_of_file))
+    if not uploads:
+        print('None of the given files could be read, not trying')
+        return False
 
     client = socket.socket()
+    set_buffer_sizes(client)
     client.connect((addr, port))
-    with client:
-        version_number = recv_single_value(client, '<i')
-        if version_number != 1:     
-            print('You are on the wrong version.')                    # Checks the version number and continues if it is 1
-            return 
-        send_bool(client, False)
-        client.sendall(struct.pack('<i', len(filenames)))
-        for filename in filenames:                      # Loops through all files trying to be uploaded
-            file_data = read_file(filename)             # Save the binary data of the file into file_data 
-            send_str(client, filename)
-            client.sendall(struct.pack('<i', len(file_data)))
-            client.sendall(file_data)                   # Sends the file data length and then the file data
+    setup_socket(client)
+    with client, open_reader(client) as rfile:
+        version_number = recv_single_value(rfile, _I32)
+        if version_number != VERSION:     
+            print('You are on the wrong version.')                    # Checks the version number and continues if it matches ours
+            return False
+        parts = [_BOOL.pack(False), _I32.pack(len(uploads))]
+        for filename, size_of_file in uploads:                      # Builds the name and size of every file into one header block
+            name = filename.encode()
+            parts += [_I32.pack(len(name)), name, _I32.pack(size_of_file)]
+        set_cork(client, True)
+        send_parts(client, parts)
+        for filename, size_of_file in uploads:                      # Then streams the data of each file one after another, one open at a time
+            with open(filename, 'rb') as file:
+                if os.fstat(file.fileno()).st_size != size_of_file:     # The server expects exactly the size in the header
+                    raise OSError(f'{filename} changed size after its header was sent')
+                send_from_file(client, file, size_of_file)
+        set_cork(client, False)
+
+    return len(uploads) == len(filenames)
 
 
 ######################################
@@ -175,50 +409,91 @@ def server_handle_request(sock):
     """
     Handles a single request using the given socket for the server.
     """
-    with sock:
-        sock.sendall(struct.pack('<i', 1))                  # Sends the version number 
-        client_connected = recv_single_value(sock, '<?')
+    with sock, open_reader(sock) as rfile:
+        sock.sendall(_I32.pack(VERSION))                    # Sends the version number 
+        client_connected = recv_single_value(rfile, _BOOL)
         if client_connected:                                # True if the client properly connects to the server 
-            filenames = recv_str_list(sock)
+            filenames = recv_str_list(rfile)
             for filename in filenames:                      # Loops through all files being taken from the server 
-                if os.path.isfile(filename):                # Checks if the file exists on the server 
-                    file_data = read_file(filename)         # Saves the binary data of the file into file_data
-                    send_bool(sock, True)           
-                    sock.sendall(struct.pack('<i', len(file_data)))
-                    sock.sendall(file_data)                 # Sends the length of the file data and then the file data
+                path = upload_path(filename)
+                if path is None:                            # Names outside of UPLOAD_DIR are treated as not existing
+                    send_status(sock, FILE_MISSING)
+                    continue
+                try:
+                    file = open(path, 'rb')
+                except FileNotFoundError:                   # The file doesn't exist on the server
+                    send_status(sock, FILE_MISSING)
+                    continue
+                except OSError as exception:                # The file can't be read, so the client is told why
+                    send_file_error(sock, exception)
+                    continue
+                with file:
+                    try:
+                        size_of_file = os.fstat(file.fileno()).st_size
+                    except OSError as exception:
+                        send_file_error(sock, exception)
+                        continue
+                    set_cork(sock, True)
+                    sock.sendall(_FILE_HEADER.pack(FILE_OK, size_of_file))
+                    send_from_file(sock, file, size_of_file)    # Sends that the file exists with the length of the file data and then streams the file data
+                    set_cork(sock, False)
 
         else:
-            amount_of_files = recv_single_value(sock, '<i')     # Saves the amount of files being uploaded from the client
-            for i in range(amount_of_files):                    # Iterates amount of dfiles times
-                filename = recv_str(sock)                       # Saves the name of the file being uploaded
-                size_of_file = recv_single_value(sock, '<i')    # Saves the size of the file being uploaded
-                file_data = recv_all(sock, size_of_file)        # Saves the data in the file being uploaded
-                save_file(filename, file_data)                  
+            amount_of_files = recv_single_value(rfile, _I32)    # Saves the amount of files being uploaded from the client
+            headers = []
+            for i in range(amount_of_files):                    # Reads the name and size of every file before any of the data
+                filename = recv_str(rfile)
+                size_of_file = recv_single_value(rfile, _I32)
+                headers.append((filename, size_of_file))
+            saved_paths = set()
+            for filename, size_of_file in headers:              # The data of each file follows in the same order
+                path = upload_path(filename)
+                if path is None:                                # Still reads the data so the next file lines up
+                    print(f'Refusing to save {filename} outside of {UPLOAD_DIR}')
+                    path = os.devnull
+                elif path in saved_paths:                       # Only the last part of the name is kept, so names can collide
+                    print(f'{filename} overwrites an earlier file uploaded as {path}')
+                saved_paths.add(path)
+                recv_to_file(rfile, size_of_file, path)         # Streams the data of the file being uploaded into the file
+
+
+def server_handle_client(sock):
+    """
+    Handles a single client on its own thread. If the client causes a problem it is reported
+    without affecting the other clients.
+    """
+    try:
+        with sock:
+            setup_socket(sock)
+            server_handle_request(sock)
+    except Exception as exception:          # Ensures that one client's exception does not stop the server
+        print(exception)
 
 
 def run_server(port):
+    """
+    Start the server running on the given port. The server accepts clients and hands each one to
+    its own thread, then goes straight back to accept another client (i.e. it has an infinite loop).
+    Each thread calls server_handle_client(), which calls server_handle_request(). If a client
+    causes a problem it is reported then the server keeps going (i.e. if server_handle_request()
+    raises any exception it is printed and the other clients are not affected).
+    """
+    raise_open_file_limit()
     server = socket.socket()
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)    # Allows restarting the server without waiting out TIME_WAIT
+    set_buffer_sizes(server)                # Accepted sockets inherit the buffer sizes
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
     server.bind(('', port))
     server.listen() 
     with server:
         while True:
             try:
                 (s, addr) = server.accept()
-                with s:
-                    server_handle_request(s)
+                threading.Thread(target=server_handle_client, args=(s,), daemon=True).start()
             except Exception as exception:          # Ensures that one exception does not stop the loop for connecting clients
                 print(exception)
 
 
-    """
-    Start the server running on the given port. The server accepts clients, handles their requests,
-    then goes back to accept another client (i.e. it has an infinite loop). To handle requests this
-    calls the server_handle_request() function. If a client causes a problem it is reported then the
-    server keeps going (i.e. if server_handle_request() raises any exception it is printed and then
-    the next client is accepted).
-    """
-
-
 
 ###################################
 ########## Main Function ##########
@@ -245,10 +520,8 @@ def main():
     elif args.cmd == 'get':
         get_files(args.address, args.port, args.file)
     elif args.cmd == 'put':
-        if not all(os.path.isfile(filename) for filename in args.file):
-            print("Not all of the given files exist, not trying")
-            return
-        put_files(args.address, args.port, args.file)
+        if not put_files(args.address, args.port, args.file):
+            sys.exit(1)
 
 if __name__ == "__main__":
     main()